@@ -2,17 +2,49 @@
 Asteroid-related behaviors for the Panspermia Simulation.
 """
 
-import random
-import math
-from entities import Asteroid
+import numpy as np
 from .base import TickBehavior
 
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the NumPy path is used instead
+    njit = None
+
+# Below this many asteroids the JIT kernel's dispatch overhead outweighs
+# the work it saves, so the NumPy path is used
+JIT_MIN_ASTEROIDS = 256
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _advance_asteroids(pos, vel, viability, contains_life, in_transit, rand,
+                           width, height, decay, leave_chance):
+        """Decay, departure sampling, motion and bounds check in one pass."""
+        n = pos.shape[0]
+        in_bounds = np.empty(n, dtype=np.bool_)
+        life_died = 0
+        for i in prange(n):
+            if contains_life[i]:
+                viability[i] -= decay
+                if viability[i] <= 0:
+                    contains_life[i] = False
+                    viability[i] = 0.0
+                    life_died += 1
+            if rand[i] < leave_chance:
+                in_transit[i] = True
+            pos[i, 0] += vel[i, 0]
+            pos[i, 1] += vel[i, 1]
+            in_bounds[i] = 0 <= pos[i, 0] < width and 0 <= pos[i, 1] < height
+        return in_bounds, life_died
+else:
+    _advance_asteroids = None
+
 
 class AsteroidSpawnBehavior(TickBehavior):
     """Handles spawning of asteroids from planets."""
 
-    def __init__(self, config):
-        super().__init__(config)
+    def __init__(self, config, rng=None):
+        super().__init__(config, rng)
         self.stats = {
             'asteroids_spawned': 0,
             'asteroids_with_life_spawned': 0,
@@ -20,56 +52,48 @@ class AsteroidSpawnBehavior(TickBehavior):
 
     def execute(self, grid, tick_number: int):
         """Attempt to spawn asteroids from planets with life."""
-        for planet in grid.get_all_planets():
-            # Only planets with life from alive stars can spawn asteroids
-            if planet.has_life and planet.parent_star.is_alive:
-                self.attempt_spawn_asteroid(planet, grid)
+        # Only planets with life from alive stars can spawn asteroids
+        eligible = np.flatnonzero(grid.planet_has_life & grid.planet_star_alive_mask())
+        if len(eligible):
+            self.spawn_asteroids(eligible, grid)
 
-    def attempt_spawn_asteroid(self, planet, grid):
-        """Attempt to spawn an asteroid from a planet."""
+    def spawn_asteroids(self, planet_indices, grid):
+        """Attempt to spawn one asteroid from each of the given planets."""
         # Life level increases spawn chance
         spawn_chance = (
             self.config.ASTEROID_SPAWN_CHANCE *
-            (1 + planet.life_level * self.config.LIFE_LEVEL_ASTEROID_MULTIPLIER)
+            (1 + grid.planet_life_level[planet_indices] * self.config.LIFE_LEVEL_ASTEROID_MULTIPLIER)
         )
+        fired = planet_indices[self.rng.random(len(planet_indices)) < spawn_chance]
+        num_spawned = len(fired)
+        if num_spawned == 0:
+            return
 
-        if random.random() < spawn_chance:
-            # Generate random direction (8 directions: cardinal + diagonal)
-            angle = random.uniform(0, 2 * math.pi)
-            velocity = (
-                math.cos(angle) * self.config.ASTEROID_SPEED,
-                math.sin(angle) * self.config.ASTEROID_SPEED
-            )
+        planet_xy = grid.planet_xy[fired]
 
-            # Start asteroid slightly offset from planet to avoid immediate collision
-            offset_x = math.cos(angle) * 1.5
-            offset_y = math.sin(angle) * 1.5
-            position = (
-                planet.position[0] + offset_x,
-                planet.position[1] + offset_y
-            )
+        # Generate random directions: normalized Gaussian vectors are
+        # uniformly distributed on the unit circle without any trig
+        directions = self.rng.standard_normal((num_spawned, 2))
+        directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+        velocities = directions * self.config.ASTEROID_SPEED
 
-            # Determine if asteroid contains life
-            contains_life = random.random() < self.config.ASTEROID_LIFE_BASE_CHANCE
+        # Start asteroids slightly offset from planet to avoid immediate collision
+        positions = planet_xy + directions * 1.5
 
-            asteroid = Asteroid(
-                position=position,
-                velocity=velocity,
-                contains_life=contains_life,
-                life_viability=self.config.ASTEROID_LIFE_INITIAL_VIABILITY if contains_life else 0.0
-            )
+        # Determine which asteroids contain life
+        contains_life = self.rng.random(num_spawned) < self.config.ASTEROID_LIFE_BASE_CHANCE
+        viability = np.where(contains_life, self.config.ASTEROID_LIFE_INITIAL_VIABILITY, 0.0)
 
-            grid.add_asteroid(asteroid)
-            self.stats['asteroids_spawned'] += 1
-            if contains_life:
-                self.stats['asteroids_with_life_spawned'] += 1
+        grid.add_asteroids(positions, velocities, contains_life, viability)
+        self.stats['asteroids_spawned'] += num_spawned
+        self.stats['asteroids_with_life_spawned'] += int(contains_life.sum())
 
 
 class AsteroidMovementBehavior(TickBehavior):
     """Handles asteroid movement, collisions, and life viability decay."""
 
-    def __init__(self, config):
-        super().__init__(config)
+    def __init__(self, config, rng=None):
+        super().__init__(config, rng)
         self.stats = {
             'asteroids_exited_grid': 0,
             'asteroid_life_died': 0,
@@ -79,56 +103,88 @@ class AsteroidMovementBehavior(TickBehavior):
 
     def execute(self, grid, tick_number: int):
         """Update all asteroids: decay life, move, check collisions."""
-        asteroids_to_remove = []
-
-        for asteroid in grid.asteroids:
-            # Decay life viability
-            if asteroid.contains_life:
-                asteroid.life_viability -= self.config.ASTEROID_LIFE_DECAY_RATE
-                if asteroid.life_viability <= 0:
-                    asteroid.contains_life = False
-                    asteroid.life_viability = 0.0
-                    self.stats['asteroid_life_died'] += 1
-
-            # Check if asteroid should leave its star system (become in_transit)
-            if not asteroid.in_transit:
-                if random.random() < self.config.ASTEROID_LEAVE_SYSTEM_CHANCE:
-                    asteroid.in_transit = True
-
-            # Move asteroid
-            asteroid.move()
-
-            # Check if out of bounds
-            if not grid.in_bounds(asteroid.position[0], asteroid.position[1]):
-                asteroids_to_remove.append(asteroid)
-                self.stats['asteroids_exited_grid'] += 1
-                continue
-
-            # Check for collision with planet
-            collided_planet = grid.find_planet_at_position(asteroid.position, tolerance=1.0)
+        num_asteroids = grid.asteroid_count
+        if num_asteroids == 0:
+            return
+
+        if _advance_asteroids is not None and num_asteroids >= JIT_MIN_ASTEROIDS:
+            in_bounds, life_died = _advance_asteroids(
+                grid.asteroid_pos,
+                grid.asteroid_vel,
+                grid.asteroid_viability,
+                grid.asteroid_contains_life,
+                grid.asteroid_in_transit,
+                self.rng.random(len(grid.asteroid_dead)),
+                grid.width,
+                grid.height,
+                self.config.ASTEROID_LIFE_DECAY_RATE,
+                self.config.ASTEROID_LEAVE_SYSTEM_CHANCE,
+            )
+        else:
+            in_bounds, life_died = self.advance_asteroids(grid)
+        grid.life_asteroid_count -= life_died
+        self.stats['asteroid_life_died'] += life_died
+
+        # Tombstoned rows are updated along with the rest but otherwise ignored
+        live = ~grid.asteroid_dead
+        remove_mask = live & ~in_bounds
+        self.stats['asteroids_exited_grid'] += int(remove_mask.sum())
+
+        # Check for collisions with planets (locals avoid repeated
+        # attribute lookups and NumPy scalar boxing in this loop)
+        find_planet = grid.find_planet_at_position
+        positions = grid.asteroid_pos.tolist()
+        for i in np.flatnonzero(live & in_bounds).tolist():
+            collided_planet = find_planet(positions[i], tolerance=1.0)
             if collided_planet:
-                self.handle_collision(asteroid, collided_planet)
-                asteroids_to_remove.append(asteroid)
+                self.handle_collision(grid, i, collided_planet)
+                remove_mask[i] = True
                 self.stats['collisions'] += 1
 
         # Remove asteroids that exited or collided
-        for asteroid in asteroids_to_remove:
-            grid.remove_asteroid(asteroid)
-
-    def handle_collision(self, asteroid, planet):
-        """Handle collision between an asteroid and a planet."""
+        grid.remove_asteroids(remove_mask)
+
+    def advance_asteroids(self, grid):
+        """
+        Decay life, sample system departure and move all asteroids.
+
+        Returns:
+            Tuple of (in-bounds mask after moving, number of asteroids
+            whose life died this tick)
+        """
+        pos = grid.asteroid_pos
+        viability = grid.asteroid_viability
+        contains_life = grid.asteroid_contains_life
+
+        # Decay life viability without data-dependent branches: lifeless
+        # asteroids already sit at zero and are clamped back to it
+        viability -= self.config.ASTEROID_LIFE_DECAY_RATE * contains_life
+        np.maximum(viability, 0.0, out=viability)
+        life_died = contains_life & (viability == 0)
+        contains_life &= ~life_died
+
+        # Check if asteroids should leave their star system (become in_transit)
+        in_transit = grid.asteroid_in_transit
+        in_transit |= self.rng.random(len(pos)) < self.config.ASTEROID_LEAVE_SYSTEM_CHANCE
+
+        # Move asteroids and check if they are still in bounds
+        pos += grid.asteroid_vel
+        return grid.in_bounds_mask(pos), int(life_died.sum())
+
+    def handle_collision(self, grid, index, planet):
+        """Handle collision between the asteroid at an index and a planet."""
         # Only attempt seeding if asteroid has life and planet doesn't
-        if asteroid.contains_life and not planet.has_life:
+        if grid.asteroid_contains_life[index] and not planet.has_life:
             # Calculate seeding success based on habitability and life viability
             success_chance = (
                 self.config.ASTEROID_SEED_BASE_SUCCESS *
                 planet.habitability *
                 self.config.HABITABILITY_SEEDING_MULTIPLIER *
-                asteroid.life_viability  # Viability affects success
+                grid.asteroid_viability[index]  # Viability affects success
             )
 
-            if random.random() < success_chance:
+            if self.rng.random() < success_chance:
                 # Successfully seed life on the planet
                 planet.has_life = True
-                planet.life_level = random.uniform(0.2, 0.5)  # Start with moderate life
+                planet.life_level = self.rng.uniform(0.2, 0.5)  # Start with moderate life
                 self.stats['successful_seedings'] += 1
@@ -4,21 +4,25 @@ Base class for tick behaviors in the Panspermia Simulation.
 
 from abc import ABC, abstractmethod
 from typing import Dict, Any
+import numpy as np
 
 
 class TickBehavior(ABC):
     """Base class for all tick behaviors."""
 
-    def __init__(self, config):
+    def __init__(self, config, rng: np.random.Generator = None):
         """
         Initialize the behavior with a configuration.
 
         Args:
             config: SimulationConfig instance
+            rng: Random generator for batched sampling, normally shared by
+                all behaviors of a simulation. If None, a fresh one is created.
         """
         self.config = config
         self.enabled = True
         self.stats = {}
+        self.rng = rng if rng is not None else np.random.default_rng()
 
     @abstractmethod
     def execute(self, grid, tick_number: int):
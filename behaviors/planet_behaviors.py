@@ -2,15 +2,15 @@
 Planet-related behaviors for the Panspermia Simulation.
 """
 
-import random
+import numpy as np
 from .base import TickBehavior
 
 
 class PlanetLifeBehavior(TickBehavior):
     """Handles life dynamics on planets (growth, decline, spontaneous generation)."""
 
-    def __init__(self, config):
-        super().__init__(config)
+    def __init__(self, config, rng=None):
+        super().__init__(config, rng)
         self.stats = {
             'spontaneous_life_events': 0,
             'life_extinctions': 0,
@@ -18,51 +18,64 @@ class PlanetLifeBehavior(TickBehavior):
 
     def execute(self, grid, tick_number: int):
         """Update life on all planets."""
-        for planet in grid.get_all_planets():
-            # Only process planets whose parent star is alive
-            if not planet.parent_star.is_alive:
-                # Star is dead - life declines faster or dies immediately
-                if planet.has_life:
-                    planet.has_life = False
-                    planet.life_level = 0.0
-                    self.stats['life_extinctions'] += 1
-                continue
+        num_planets = len(grid.planets)
+        if num_planets == 0:
+            return
 
-            # Check for spontaneous life generation
-            if not planet.has_life:
-                self.check_spontaneous_life(planet)
+        has_life = grid.planet_has_life
+        star_alive = grid.planet_star_alive_mask()
 
-            # Update existing life
-            if planet.has_life:
-                self.update_life_level(planet)
+        # Star is dead - life dies immediately
+        extinct = has_life & ~star_alive
+        num_extinct = int(extinct.sum())
+        has_life[extinct] = False
+        grid.planet_life_level[extinct] = 0.0
+        grid.living_planet_count -= num_extinct
+        self.stats['life_extinctions'] += num_extinct
 
-    def check_spontaneous_life(self, planet):
-        """Check if life spontaneously appears on a planet."""
+        samples = self.rng.random((num_planets, 3))
+        self.check_spontaneous_life(grid, star_alive, samples[:, 0])
+        self.update_life_level(grid, samples[:, 1], samples[:, 2])
+
+    def check_spontaneous_life(self, grid, star_alive, samples):
+        """Check if life spontaneously appears on planets of living stars."""
         # Higher habitability increases chance of spontaneous life
-        adjusted_chance = self.config.SPONTANEOUS_LIFE_CHANCE * planet.habitability
+        adjusted_chance = self.config.SPONTANEOUS_LIFE_CHANCE * grid.planet_habitability
+
+        spontaneous = ~grid.planet_has_life & star_alive & (samples < adjusted_chance)
+        num_events = int(spontaneous.sum())
+        if num_events:
+            grid.planet_has_life[spontaneous] = True
+            # Start with low life level
+            grid.planet_life_level[spontaneous] = self.rng.uniform(0.1, 0.3, num_events)
+            grid.living_planet_count += num_events
+            self.stats['spontaneous_life_events'] += num_events
 
-        if random.random() < adjusted_chance:
-            planet.has_life = True
-            planet.life_level = random.uniform(0.1, 0.3)  # Start with low life level
-            self.stats['spontaneous_life_events'] += 1
+    def update_life_level(self, grid, growth_samples, decline_samples):
+        """Update the life level on living planets (growth or decline)."""
+        has_life = grid.planet_has_life
+        habitability = grid.planet_habitability
+        life_level = grid.planet_life_level
 
-    def update_life_level(self, planet):
-        """Update the life level on a planet (growth or decline)."""
         # Habitability affects growth and decline rates
-        growth_chance = self.config.LIFE_GROWTH_CHANCE * planet.habitability
+        growth_chance = self.config.LIFE_GROWTH_CHANCE * habitability
         decline_chance = self.config.LIFE_DECLINE_CHANCE * (
-            2.0 - planet.habitability * self.config.HABITABILITY_SUSTAIN_MULTIPLIER
+            2.0 - habitability * self.config.HABITABILITY_SUSTAIN_MULTIPLIER
         )
+        growth = has_life & (growth_samples < growth_chance)
+        decline = has_life & (decline_samples < decline_chance)
 
         # Growth
-        if random.random() < growth_chance:
-            planet.life_level = min(1.0, planet.life_level + 0.1)
+        life_level += 0.1 * growth
+        np.minimum(life_level, 1.0, out=life_level)
 
         # Decline
-        if random.random() < decline_chance:
-            planet.life_level = max(0.0, planet.life_level - 0.1)
+        life_level -= 0.1 * decline
+        np.maximum(life_level, 0.0, out=life_level)
 
-            # Life goes extinct if level reaches 0
-            if planet.life_level <= 0:
-                planet.has_life = False
-                self.stats['life_extinctions'] += 1
+        # Life goes extinct if level reaches 0
+        extinct = decline & (life_level <= 0)
+        num_extinct = int(extinct.sum())
+        has_life[extinct] = False
+        grid.living_planet_count -= num_extinct
+        self.stats['life_extinctions'] += num_extinct
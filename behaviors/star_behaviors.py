@@ -8,8 +8,8 @@ from .base import TickBehavior
 class StarAgingBehavior(TickBehavior):
     """Handles star aging and death."""
 
-    def __init__(self, config):
-        super().__init__(config)
+    def __init__(self, config, rng=None):
+        super().__init__(config, rng)
         self.stats = {
             'stars_died': 0,
         }
@@ -22,10 +22,10 @@ class StarAgingBehavior(TickBehavior):
 
                 # Check if star has exceeded its lifetime
                 if star.age >= star.lifetime:
-                    self.handle_star_death(star)
+                    self.handle_star_death(grid, star)
                     self.stats['stars_died'] += 1
 
-    def handle_star_death(self, star):
+    def handle_star_death(self, grid, star):
         """
         Handle when a star dies.
         Currently just marks it as dead.
@@ -48,7 +48,11 @@ class SimulationConfig:
 
     # Simulation Control
     MAX_TICKS: int = 1000
-    RANDOM_SEED: int = None  # Set to an integer for reproducible simulations
+    # Set to an integer for reproducible simulations. Seeds the NumPy
+    # generator behind world generation and all behaviors. Runs are
+    # reproducible per seed, with or without Numba, but differ from
+    # pre-NumPy versions.
+    RANDOM_SEED: int = None
 
     # Visualization
     DISPLAY_EVERY_N_TICKS: int = 10  # How often to show visualization (0 = only final state)
@@ -8,7 +8,15 @@ import math
 
 
 class Star:
-    """Represents a star in the simulation."""
+    """
+    Represents a star in the simulation.
+
+    Once added to a grid with Grid.add_star, whether the star is alive is
+    stored in the grid's star arrays, and setting is_alive keeps them and
+    the grid's alive star count up to date.
+    """
+
+    __slots__ = ('position', 'lifetime', 'age', '_is_alive', 'planets', 'grid', 'index')
 
     def __init__(
         self,
@@ -18,8 +26,25 @@ class Star:
         self.position = position
         self.lifetime = lifetime
         self.age = 0
-        self.is_alive = True
+        self._is_alive = True  # Used until the star is added to a grid
         self.planets: List['Planet'] = []
+        self.grid = None
+        self.index: Optional[int] = None  # Position in Grid.stars, set by Grid.add_star
+
+    @property
+    def is_alive(self) -> bool:
+        if self.grid is None:
+            return self._is_alive
+        return bool(self.grid.star_alive[self.index])
+
+    @is_alive.setter
+    def is_alive(self, value: bool):
+        grid = self.grid
+        if grid is None:
+            self._is_alive = value
+        elif value != grid.star_alive[self.index]:
+            grid.alive_star_count += 1 if value else -1
+            grid.star_alive[self.index] = value
 
     def add_planet(self, planet: 'Planet'):
         """Add a planet to this star system."""
@@ -30,25 +55,69 @@ class Star:
 
 
 class Planet:
-    """Represents a planet orbiting a star."""
+    """
+    Represents a planet orbiting a star.
+
+    Habitability and life state live in the grid's planet arrays so they
+    can be updated in batch; a Planet is a view onto one row of them.
+    Planets are created with Grid.add_planet.
+    """
+
+    __slots__ = ('grid', 'index', 'x', 'y', 'parent_star')
 
     def __init__(
         self,
+        grid,
+        index: int,
         position: Tuple[int, int],
         parent_star: Star,
-        habitability: float,
     ):
-        self.position = position
+        self.grid = grid
+        self.index = index
+        self.x, self.y = position
         self.parent_star = parent_star
-        self.habitability = habitability
-        self.has_life = False
-        self.life_level = 0.0  # 0.0 to 1.0
+
+    @property
+    def position(self) -> Tuple[int, int]:
+        return (self.x, self.y)
+
+    @property
+    def parent_star_idx(self) -> int:
+        return int(self.grid.planet_star_idx[self.index])
+
+    @property
+    def habitability(self) -> float:
+        return float(self.grid.planet_habitability[self.index])
+
+    @property
+    def has_life(self) -> bool:
+        return bool(self.grid.planet_has_life[self.index])
+
+    @has_life.setter
+    def has_life(self, value: bool):
+        grid = self.grid
+        if value != grid.planet_has_life[self.index]:
+            grid.living_planet_count += 1 if value else -1
+            grid.planet_has_life[self.index] = value
+
+    @property
+    def life_level(self) -> float:
+        """Life level from 0.0 to 1.0."""
+        return float(self.grid.planet_life_level[self.index])
+
+    @life_level.setter
+    def life_level(self, value: float):
+        self.grid.planet_life_level[self.index] = value
 
     def distance_to(self, other_position: Tuple[float, float]) -> float:
         """Calculate Euclidean distance to another position."""
-        dx = self.position[0] - other_position[0]
-        dy = self.position[1] - other_position[1]
-        return math.sqrt(dx * dx + dy * dy)
+        return math.sqrt(self.squared_distance_to(other_position))
+
+    def squared_distance_to(self, other_position: Tuple[float, float]) -> float:
+        """Calculate squared Euclidean distance, for cheap threshold tests."""
+        dx = self.x - other_position[0]
+        dy = self.y - other_position[1]
+        return dx * dx + dy * dy
 
     def __repr__(self):
         life_str = f"life={self.life_level:.2f}" if self.has_life else "no life"
@@ -56,34 +125,65 @@ class Planet:
 
 
 class Asteroid:
-    """Represents an asteroid traveling through space."""
+    """
+    Represents an asteroid traveling through space.
+
+    Asteroids on a grid live in its asteroid arrays; the Asteroid objects
+    returned by Grid.asteroids and Grid.get_asteroid are read-only
+    snapshots, and setting an attribute on one raises AttributeError.
+    """
+
+    __slots__ = (
+        'pos_x', 'pos_y', 'vel_x', 'vel_y', 'contains_life', 'life_viability', 'in_transit',
+        '_read_only',
+    )
 
     def __init__(
         self,
-        position: Tuple[float, float],
-        velocity: Tuple[float, float],
+        pos_x: float,
+        pos_y: float,
+        vel_x: float,
+        vel_y: float,
         contains_life: bool = False,
         life_viability: float = 1.0,
+        in_transit: bool = False,
+        read_only: bool = False,
     ):
-        self.position = position
-        self.velocity = velocity
+        self.pos_x = pos_x
+        self.pos_y = pos_y
+        self.vel_x = vel_x
+        self.vel_y = vel_y
         self.contains_life = contains_life
         self.life_viability = life_viability
-        self.in_transit = False  # Whether it has left its star system
+        self.in_transit = in_transit  # Whether it has left its star system
+        self._read_only = read_only
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_read_only', False):
+            raise AttributeError(
+                "Asteroid snapshots are read-only; update the grid's asteroid arrays instead"
+            )
+        object.__setattr__(self, name, value)
+
+    @property
+    def position(self) -> Tuple[float, float]:
+        return (self.pos_x, self.pos_y)
+
+    @property
+    def velocity(self) -> Tuple[float, float]:
+        return (self.vel_x, self.vel_y)
 
     def move(self):
         """Move the asteroid according to its velocity."""
-        self.position = (
-            self.position[0] + self.velocity[0],
-            self.position[1] + self.velocity[1]
-        )
+        self.pos_x += self.vel_x
+        self.pos_y += self.vel_y
 
     def distance_to(self, other_position: Tuple[float, float]) -> float:
         """Calculate Euclidean distance to another position."""
-        dx = self.position[0] - other_position[0]
-        dy = self.position[1] - other_position[1]
+        dx = self.pos_x - other_position[0]
+        dy = self.pos_y - other_position[1]
         return math.sqrt(dx * dx + dy * dy)
 
     def __repr__(self):
         life_str = f"life={self.life_viability:.2f}" if self.contains_life else "no life"
-        return f"Asteroid(pos=({self.position[0]:.1f},{self.position[1]:.1f}), vel={self.velocity}, {life_str})"
+        return f"Asteroid(pos=({self.pos_x:.1f},{self.pos_y:.1f}), vel={self.velocity}, {life_str})"
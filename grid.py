@@ -3,57 +3,321 @@ Grid class for the Panspermia Simulation.
 Manages the simulation space and entities.
 """
 
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
+import numpy as np
 from entities import Star, Planet, Asteroid
 
+# Removed asteroids are left as tombstones until they make up more than
+# this fraction of the asteroid arrays, then compacted away in one pass
+ASTEROID_COMPACT_FRACTION = 0.25
+
+# Rows preallocated for asteroid arrays; capacity doubles when exceeded
+INITIAL_ASTEROID_CAPACITY = 1024
+
+# Per-asteroid array fields: name -> (shape of one row, dtype)
+_ASTEROID_FIELDS = {
+    'asteroid_pos': ((2,), np.float32),
+    'asteroid_vel': ((2,), np.float32),
+    'asteroid_viability': ((), np.float64),
+    'asteroid_contains_life': ((), bool),
+    'asteroid_in_transit': ((), bool),
+    'asteroid_dead': ((), bool),
+}
+
+
+def _asteroid_rows_view(name: str) -> property:
+    """Property exposing the in-use rows of a preallocated asteroid buffer."""
+    buffer_name = '_' + name
+
+    def getter(self):
+        return getattr(self, buffer_name)[:self._asteroid_rows]
+
+    return property(getter)
+
 
 class Grid:
     """Represents the simulation grid containing stars and asteroids."""
 
+    asteroid_pos = _asteroid_rows_view('asteroid_pos')
+    asteroid_vel = _asteroid_rows_view('asteroid_vel')
+    asteroid_viability = _asteroid_rows_view('asteroid_viability')
+    asteroid_contains_life = _asteroid_rows_view('asteroid_contains_life')
+    asteroid_in_transit = _asteroid_rows_view('asteroid_in_transit')
+    asteroid_dead = _asteroid_rows_view('asteroid_dead')
+
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
         self.stars: List[Star] = []
-        self.asteroids: List[Asteroid] = []
+        self.planets: List[Planet] = []
+
+        # Star position and alive flag, indexed by Star.index, so planets
+        # and renderers can read star state without walking Star objects
+        self.star_xy = np.empty((0, 2), dtype=np.int64)
+        self.star_alive = np.empty(0, dtype=bool)
+
+        # Population counters, kept up to date on state transitions so
+        # statistics don't need to rescan entities
+        self.alive_star_count = 0
+        self.living_planet_count = 0
+        self.life_asteroid_count = 0
+
+        # Planet state is stored as a structure of arrays indexed by
+        # Planet.index; Planet objects are views onto these rows
+        self.planet_xy = np.empty((0, 2), dtype=np.int64)
+        self.planet_star_idx = np.empty(0, dtype=np.int64)
+        self.planet_habitability = np.empty(0, dtype=np.float64)
+        self.planet_life_level = np.empty(0, dtype=np.float64)
+        self.planet_has_life = np.empty(0, dtype=bool)
+
+        # Planets never move, so the spatial hash used for collision
+        # lookups is cached until a planet is added
+        self._planet_cells: Optional[Dict[Tuple[int, int], List[Planet]]] = None
+        self._planet_cell_size = 0
+
+        # Asteroids are stored as a structure of arrays so behaviors can
+        # update them with vectorized operations (one row per asteroid).
+        # The arrays are preallocated buffers that double when full; the
+        # public asteroid_* properties are views of the rows in use. Rows
+        # flagged in asteroid_dead are removed asteroids awaiting
+        # compaction and must be ignored.
+        self._asteroid_rows = 0
+        self._dead_asteroid_count = 0
+        self._allocate_asteroid_buffers(INITIAL_ASTEROID_CAPACITY)
 
     def add_star(self, star: Star):
         """Add a star to the grid."""
+        is_alive = star.is_alive
+        star.index = len(self.stars)
         self.stars.append(star)
+        self.star_xy = np.concatenate((self.star_xy, [star.position]))
+        self.star_alive = np.append(self.star_alive, is_alive)
+        if is_alive:
+            self.alive_star_count += 1
+        star.grid = self
+
+    def add_planet(
+        self,
+        position: Tuple[int, int],
+        parent_star: Star,
+        habitability: float,
+    ) -> Planet:
+        """
+        Create a planet on the grid.
+
+        The caller is responsible for attaching it to its parent star.
+
+        Returns:
+            The new Planet view
+        """
+        return self.add_planets([position], [parent_star], [habitability])[0]
+
+    def add_planets(
+        self,
+        positions: np.ndarray,
+        parent_stars: List[Star],
+        habitability: np.ndarray,
+    ) -> List[Planet]:
+        """
+        Create a batch of planets on the grid.
+
+        Args:
+            positions: (k, 2) array of integer positions
+            parent_stars: Parent star of each planet (already on this grid)
+            habitability: (k,) array of habitability values
+
+        Returns:
+            The new Planet views, in order
+        """
+        positions = np.asarray(positions, dtype=np.int64).reshape(-1, 2)
+        first_index = len(self.planets)
+        planets = [
+            Planet(grid=self, index=first_index + i, position=(x, y), parent_star=star)
+            for i, ((x, y), star) in enumerate(zip(positions.tolist(), parent_stars))
+        ]
+        num_planets = len(planets)
+
+        self.planets.extend(planets)
+        self.planet_xy = np.concatenate((self.planet_xy, positions))
+        self.planet_star_idx = np.concatenate(
+            (self.planet_star_idx, np.array([star.index for star in parent_stars], dtype=np.int64))
+        )
+        self.planet_habitability = np.concatenate(
+            (self.planet_habitability, np.asarray(habitability, dtype=np.float64))
+        )
+        self.planet_life_level = np.concatenate((self.planet_life_level, np.zeros(num_planets)))
+        self.planet_has_life = np.concatenate((self.planet_has_life, np.zeros(num_planets, dtype=bool)))
+        self._planet_cells = None
+        return planets
+
+    def planet_star_alive_mask(self) -> np.ndarray:
+        """Boolean array, True for planets whose parent star is alive."""
+        return self.star_alive[self.planet_star_idx]
+
+    @property
+    def asteroid_count(self) -> int:
+        """Number of asteroids currently on the grid."""
+        return self._asteroid_rows - self._dead_asteroid_count
+
+    @property
+    def asteroids(self) -> List[Asteroid]:
+        """
+        Read-only Asteroid snapshots built from the array storage.
+
+        To change asteroids, update the asteroid_* arrays (and
+        life_asteroid_count), or use add_asteroids and remove_asteroids.
+        """
+        return [self.get_asteroid(i) for i in np.flatnonzero(~self.asteroid_dead)]
+
+    def get_asteroid(self, index: int) -> Asteroid:
+        """Build a read-only Asteroid snapshot of the asteroid stored at an index."""
+        pos_x, pos_y = self.asteroid_pos[index].tolist()
+        vel_x, vel_y = self.asteroid_vel[index].tolist()
+        return Asteroid(
+            pos_x=pos_x,
+            pos_y=pos_y,
+            vel_x=vel_x,
+            vel_y=vel_y,
+            contains_life=bool(self.asteroid_contains_life[index]),
+            life_viability=float(self.asteroid_viability[index]),
+            in_transit=bool(self.asteroid_in_transit[index]),
+            read_only=True,
+        )
 
     def add_asteroid(self, asteroid: Asteroid):
         """Add an asteroid to the grid."""
-        self.asteroids.append(asteroid)
+        self.add_asteroids(
+            positions=np.array([[asteroid.pos_x, asteroid.pos_y]]),
+            velocities=np.array([[asteroid.vel_x, asteroid.vel_y]]),
+            contains_life=np.array([asteroid.contains_life]),
+            viability=np.array([asteroid.life_viability]),
+        )
+        self._asteroid_in_transit[self._asteroid_rows - 1] = asteroid.in_transit
+
+    def add_asteroids(
+        self,
+        positions: np.ndarray,
+        velocities: np.ndarray,
+        contains_life: np.ndarray,
+        viability: np.ndarray,
+    ):
+        """
+        Add a batch of asteroids to the grid.
+
+        Args:
+            positions: (k, 2) array of positions
+            velocities: (k, 2) array of velocities
+            contains_life: (k,) boolean array
+            viability: (k,) array of life viability values
+        """
+        contains_life = np.asarray(contains_life, dtype=bool)
+        start = self._asteroid_rows
+        end = start + len(contains_life)
+        if end > len(self._asteroid_dead):
+            self._allocate_asteroid_buffers(max(end, 2 * len(self._asteroid_dead)))
+
+        self._asteroid_pos[start:end] = positions
+        self._asteroid_vel[start:end] = velocities
+        self._asteroid_viability[start:end] = viability
+        self._asteroid_contains_life[start:end] = contains_life
+        self._asteroid_in_transit[start:end] = False
+        self._asteroid_dead[start:end] = False
+        self._asteroid_rows = end
+        self.life_asteroid_count += int(contains_life.sum())
+
+    def _allocate_asteroid_buffers(self, capacity: int):
+        """(Re)allocate the asteroid buffers, keeping the rows in use."""
+        rows = self._asteroid_rows
+        for name, (row_shape, dtype) in _ASTEROID_FIELDS.items():
+            buffer = np.zeros((capacity,) + row_shape, dtype=dtype)
+            if rows:
+                buffer[:rows] = getattr(self, name)
+            setattr(self, '_' + name, buffer)
 
-    def remove_asteroid(self, asteroid: Asteroid):
-        """Remove an asteroid from the grid."""
-        if asteroid in self.asteroids:
-            self.asteroids.remove(asteroid)
+    def remove_asteroids(self, remove_mask: np.ndarray):
+        """
+        Remove asteroids from the grid.
+
+        Removed rows are marked as tombstones (with their life cleared) and
+        only compacted once they exceed ASTEROID_COMPACT_FRACTION of the
+        arrays, so most ticks don't reallocate the asteroid arrays.
+
+        Args:
+            remove_mask: (N,) boolean array, True for live asteroids to remove
+        """
+        num_removed = int(remove_mask.sum())
+        if num_removed == 0:
+            return
+
+        self.life_asteroid_count -= int(self.asteroid_contains_life[remove_mask].sum())
+        dead = self.asteroid_dead
+        dead |= remove_mask
+        self.asteroid_contains_life[remove_mask] = False
+        self.asteroid_viability[remove_mask] = 0.0
+        self._dead_asteroid_count += num_removed
+
+        if self._dead_asteroid_count > ASTEROID_COMPACT_FRACTION * self._asteroid_rows:
+            self._compact_asteroids()
+
+    def _compact_asteroids(self):
+        """Move live asteroid rows to the front of the buffers."""
+        keep = ~self.asteroid_dead
+        rows = int(keep.sum())
+        for name in _ASTEROID_FIELDS:
+            buffer = getattr(self, '_' + name)
+            buffer[:rows] = buffer[:self._asteroid_rows][keep]
+        self._asteroid_dead[:rows] = False
+        self._asteroid_rows = rows
+        self._dead_asteroid_count = 0
 
     def in_bounds(self, x: float, y: float) -> bool:
         """Check if a position is within grid bounds."""
         return 0 <= x < self.width and 0 <= y < self.height
 
+    def in_bounds_mask(self, positions: np.ndarray) -> np.ndarray:
+        """Vectorized in_bounds check over an (N, 2) array of positions."""
+        x = positions[:, 0]
+        y = positions[:, 1]
+        return (x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+
     def get_all_planets(self) -> List[Planet]:
         """Get all planets from all star systems."""
-        planets = []
-        for star in self.stars:
-            planets.extend(star.planets)
-        return planets
+        return self.planets
 
     def get_living_planets(self) -> List[Planet]:
         """Get all planets that currently have life."""
-        return [p for p in self.get_all_planets() if p.has_life]
+        return [self.planets[i] for i in np.flatnonzero(self.planet_has_life)]
 
     def get_asteroids_with_life(self) -> List[Asteroid]:
         """Get all asteroids that contain life."""
-        return [a for a in self.asteroids if a.contains_life]
+        return [self.get_asteroid(i) for i in np.flatnonzero(self.asteroid_contains_life)]
 
     def find_planet_at_position(self, position: Tuple[float, float], tolerance: float = 1.0) -> Planet:
         """Find a planet at or near a given position within tolerance distance."""
-        for planet in self.get_all_planets():
-            if planet.distance_to(position) <= tolerance:
-                return planet
+        # Cells are at least as wide as the tolerance, so any match lies in
+        # the 3x3 block of cells around the position
+        cell_size = max(1, int(tolerance * 2))
+        if self._planet_cells is None or cell_size != self._planet_cell_size:
+            self._build_planet_cells(cell_size)
+
+        tolerance_sq = tolerance * tolerance
+        cx = int(position[0] // cell_size)
+        cy = int(position[1] // cell_size)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for planet in self._planet_cells.get((cx + dx, cy + dy), ()):
+                    if planet.squared_distance_to(position) <= tolerance_sq:
+                        return planet
         return None
 
+    def _build_planet_cells(self, cell_size: int):
+        """Bucket all planets into a spatial hash of square cells."""
+        cells: Dict[Tuple[int, int], List[Planet]] = {}
+        for planet in self.planets:
+            key = (planet.x // cell_size, planet.y // cell_size)
+            cells.setdefault(key, []).append(planet)
+        self._planet_cells = cells
+        self._planet_cell_size = cell_size
+
     def __repr__(self):
-        return f"Grid({self.width}x{self.height}, stars={len(self.stars)}, asteroids={len(self.asteroids)})"
+        return f"Grid({self.width}x{self.height}, stars={len(self.stars)}, asteroids={self.asteroid_count})"
@@ -9,7 +9,9 @@ where asteroids carrying microbial life can seed other planets.
 import argparse
 from config import SimulationConfig
 from simulation import Simulation
-from visualizer import ASCIIVisualizer, CompactVisualizer, DetailedVisualizer
+from visualizer import (
+    ASCIIVisualizer, CompactVisualizer, DetailedVisualizer, close_visualizer, flush_visualizer,
+)
 
 
 def main():
@@ -71,6 +73,16 @@ def main():
         default=1,
         help='ASCII visualizer scale factor (default: 1)'
     )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='ASCII visualizer redraws only changed cells in place (terminal only)'
+    )
+    parser.add_argument(
+        '--background-output',
+        action='store_true',
+        help='ASCII visualizer writes frames from a background thread'
+    )
     parser.add_argument(
         '--no-stats',
         action='store_true',
@@ -91,7 +103,11 @@ def main():
 
     # Create visualizer
     if args.visualizer == 'ascii':
-        visualizer = ASCIIVisualizer(scale=args.scale)
+        visualizer = ASCIIVisualizer(
+            scale=args.scale,
+            incremental=args.incremental,
+            background=args.background_output,
+        )
     elif args.visualizer == 'compact':
         visualizer = CompactVisualizer()
     elif args.visualizer == 'detailed':
@@ -115,8 +131,8 @@ def main():
     sim = Simulation(config)
 
     print(f"\nInitialized with {len(sim.grid.stars)} stars and "
-          f"{len(sim.grid.get_all_planets())} planets")
-    print(f"Starting life planets: {len(sim.grid.get_living_planets())}\n")
+          f"{len(sim.grid.planets)} planets")
+    print(f"Starting life planets: {sim.grid.living_planet_count}\n")
 
     # Run simulation
     try:
@@ -126,8 +142,11 @@ def main():
         print(f"\n=== State at Tick {sim.tick_number} ===")
         if visualizer:
             visualizer.render(sim)
+            flush_visualizer(visualizer)
         sim.print_stats()
         sim.print_behavior_stats()
+    finally:
+        close_visualizer(visualizer)
 
     print("\n" + "=" * 60)
     print("SIMULATION COMPLETE")
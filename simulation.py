@@ -2,12 +2,13 @@
 Main simulation class for the Panspermia Simulation.
 """
 
-import random
 import math
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+import numpy as np
 from config import SimulationConfig
 from grid import Grid
-from entities import Star, Planet
+from entities import Star
+from visualizer import flush_visualizer
 from behaviors import (
     StarAgingBehavior,
     PlanetLifeBehavior,
@@ -15,6 +16,14 @@ from behaviors import (
     AsteroidMovementBehavior,
 )
 
+MIN_STAR_DISTANCE = 10  # Minimum distance between stars
+MIN_STAR_DISTANCE_SQ = MIN_STAR_DISTANCE * MIN_STAR_DISTANCE
+
+# Star placement buckets stars into square cells with a diagonal of
+# MIN_STAR_DISTANCE, so a cell can hold at most one well-spaced star and any
+# star too close to a point lies within two cells of it
+STAR_CELL_SIZE = MIN_STAR_DISTANCE / math.sqrt(2)
+
 
 class Simulation:
     """Main simulation class coordinating all behaviors and entities."""
@@ -34,17 +43,20 @@ class Simulation:
         self.grid = Grid(config.GRID_SIZE[0], config.GRID_SIZE[1])
         self.tick_number = 0
 
-        # Set random seed if specified
-        if config.RANDOM_SEED is not None:
-            random.seed(config.RANDOM_SEED)
+        # World generation and all behaviors draw from one shared generator,
+        # seeded from RANDOM_SEED if specified
+        self.rng = np.random.default_rng(config.RANDOM_SEED)
 
         # Initialize behaviors in execution order
         self.behaviors = [
-            (1, StarAgingBehavior(config)),          # Phase 1: Environmental changes
-            (2, PlanetLifeBehavior(config)),         # Phase 2: Life processes
-            (3, AsteroidSpawnBehavior(config)),      # Phase 3: Asteroid generation
-            (4, AsteroidMovementBehavior(config)),   # Phase 4: Movement & collision
+            (1, StarAgingBehavior(config, self.rng)),          # Phase 1: Environmental changes
+            (2, PlanetLifeBehavior(config, self.rng)),         # Phase 2: Life processes
+            (3, AsteroidSpawnBehavior(config, self.rng)),      # Phase 3: Asteroid generation
+            (4, AsteroidMovementBehavior(config, self.rng)),   # Phase 4: Movement & collision
         ]
+        self._sorted_behaviors = tuple(
+            behavior for _, behavior in sorted(self.behaviors, key=lambda x: x[0])
+        )
 
         # Initialize the world
         self._initialize_world()
@@ -52,106 +64,114 @@ class Simulation:
     def _initialize_world(self):
         """Initialize the simulation world with stars and planets."""
         # Spawn stars at random positions
+        star_cells: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
         for _ in range(self.config.NUM_STARS):
             # Find a position not too close to existing stars
-            position = self._find_valid_star_position()
+            position = self._find_valid_star_position(star_cells)
 
             # Random lifetime for this star
-            lifetime = random.randint(
+            lifetime = int(self.rng.integers(
                 self.config.STAR_MIN_LIFETIME,
-                self.config.STAR_MAX_LIFETIME
-            )
+                self.config.STAR_MAX_LIFETIME + 1
+            ))
 
             star = Star(position=position, lifetime=lifetime)
             self.grid.add_star(star)
 
-            # Spawn planets around this star
-            self._spawn_planets_for_star(star)
+        # Spawn planets around all stars
+        self._spawn_planets()
 
         # Seed initial life on random planets
         self._seed_initial_life()
 
-    def _find_valid_star_position(self) -> Tuple[int, int]:
-        """Find a valid position for a star (not too close to others)."""
-        min_distance = 10  # Minimum distance between stars
+    def _find_valid_star_position(
+        self, star_cells: Dict[Tuple[int, int], List[Tuple[int, int]]]
+    ) -> Tuple[int, int]:
+        """
+        Find a valid position for a star (not too close to others).
 
+        Args:
+            star_cells: Positions of the stars placed so far, bucketed by
+                STAR_CELL_SIZE cell. Updated in place with the chosen position.
+        """
         for _ in range(100):  # Try up to 100 times
-            x = random.randint(0, self.grid.width - 1)
-            y = random.randint(0, self.grid.height - 1)
-
-            # Check distance to other stars
-            valid = True
-            for star in self.grid.stars:
-                dx = x - star.position[0]
-                dy = y - star.position[1]
-                distance = math.sqrt(dx * dx + dy * dy)
-                if distance < min_distance:
-                    valid = False
-                    break
-
-            if valid:
-                return (x, y)
-
-        # If we couldn't find a valid position, just return a random one
-        return (
-            random.randint(0, self.grid.width - 1),
-            random.randint(0, self.grid.height - 1)
+            x = int(self.rng.integers(self.grid.width))
+            y = int(self.rng.integers(self.grid.height))
+            if not self._star_too_close(star_cells, x, y):
+                break
+        # If no valid position was found, the last random one is used
+
+        key = (int(x // STAR_CELL_SIZE), int(y // STAR_CELL_SIZE))
+        star_cells.setdefault(key, []).append((x, y))
+        return (x, y)
+
+    @staticmethod
+    def _star_too_close(star_cells: Dict[Tuple[int, int], List[Tuple[int, int]]], x: int, y: int) -> bool:
+        """Check whether a placed star is closer than MIN_STAR_DISTANCE to a position."""
+        cx = int(x // STAR_CELL_SIZE)
+        cy = int(y // STAR_CELL_SIZE)
+        for dx in range(-2, 3):
+            for dy in range(-2, 3):
+                for sx, sy in star_cells.get((cx + dx, cy + dy), ()):
+                    if (x - sx) ** 2 + (y - sy) ** 2 < MIN_STAR_DISTANCE_SQ:
+                        return True
+        return False
+
+    def _spawn_planets(self):
+        """Spawn planets orbiting all stars in one batch."""
+        stars = self.grid.stars
+        if not stars:
+            return
+        star_xy = np.array([star.position for star in stars])
+
+        # Determine number of planets per star
+        spawn_rolls = self.rng.random((len(stars), self.config.MAX_PLANETS_PER_STAR))
+        counts = (spawn_rolls < self.config.PLANET_SPAWN_CHANCE).sum(axis=1)
+        star_indices = np.repeat(np.arange(len(stars)), counts)
+        num_planets = len(star_indices)
+
+        # Random direction (normalized Gaussian, no trig) and distance from star
+        directions = self.rng.standard_normal((num_planets, 2))
+        directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+        distances = self.rng.uniform(1, self.config.PLANET_ORBIT_RADIUS, num_planets)
+
+        # Calculate positions, within grid bounds
+        offsets = (directions * distances[:, None]).astype(np.int64)
+        xy = star_xy[star_indices] + offsets
+        np.clip(xy[:, 0], 0, self.grid.width - 1, out=xy[:, 0])
+        np.clip(xy[:, 1], 0, self.grid.height - 1, out=xy[:, 1])
+
+        # Random habitability
+        habitability = self.rng.uniform(
+            self.config.PLANET_HABITABILITY_MIN,
+            self.config.PLANET_HABITABILITY_MAX,
+            num_planets
         )
 
-    def _spawn_planets_for_star(self, star: Star):
-        """Spawn planets orbiting a star."""
-        # Determine number of planets
-        num_planets = 0
-        for _ in range(self.config.MAX_PLANETS_PER_STAR):
-            if random.random() < self.config.PLANET_SPAWN_CHANCE:
-                num_planets += 1
-
-        # Create planets at random positions around the star
-        for _ in range(num_planets):
-            # Random angle and distance from star
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(1, self.config.PLANET_ORBIT_RADIUS)
-
-            # Calculate position
-            x = star.position[0] + int(math.cos(angle) * distance)
-            y = star.position[1] + int(math.sin(angle) * distance)
-
-            # Ensure position is within grid bounds
-            x = max(0, min(self.grid.width - 1, x))
-            y = max(0, min(self.grid.height - 1, y))
-
-            # Random habitability
-            habitability = random.uniform(
-                self.config.PLANET_HABITABILITY_MIN,
-                self.config.PLANET_HABITABILITY_MAX
-            )
-
-            planet = Planet(
-                position=(x, y),
-                parent_star=star,
-                habitability=habitability
-            )
+        parent_stars = [stars[i] for i in star_indices]
+        planets = self.grid.add_planets(xy, parent_stars, habitability)
+        for star, planet in zip(parent_stars, planets):
             star.add_planet(planet)
 
     def _seed_initial_life(self):
         """Seed life on initial planets."""
-        all_planets = self.grid.get_all_planets()
+        all_planets = self.grid.planets
         if not all_planets:
             return
 
         # Randomly select planets to seed with life
         num_to_seed = min(self.config.INITIAL_LIFE_PLANETS, len(all_planets))
-        seeded_planets = random.sample(all_planets, num_to_seed)
+        seeded = self.rng.choice(len(all_planets), num_to_seed, replace=False)
 
-        for planet in seeded_planets:
+        for index in seeded:
+            planet = all_planets[index]
             planet.has_life = True
-            planet.life_level = random.uniform(0.3, 0.7)
+            planet.life_level = float(self.rng.uniform(0.3, 0.7))
 
     def tick(self):
         """Execute one tick of the simulation."""
         # Execute behaviors in priority order
-        sorted_behaviors = sorted(self.behaviors, key=lambda x: x[0])
-        for priority, behavior in sorted_behaviors:
+        for behavior in self._sorted_behaviors:
             if behavior.enabled:
                 behavior.execute(self.grid, self.tick_number)
 
@@ -163,7 +183,9 @@ class Simulation:
 
         Args:
             num_ticks: Number of ticks to run. If None, uses config.MAX_TICKS
-            visualizer: Optional visualizer instance for rendering
+            visualizer: Optional visualizer instance for rendering. If it has
+                a flush() method, it is called before the simulation prints
+                anything itself.
         """
         if num_ticks is None:
             num_ticks = self.config.MAX_TICKS
@@ -178,12 +200,15 @@ class Simulation:
 
             # Show stats
             if self.config.SHOW_STATS and self.tick_number % 100 == 0:
+                flush_visualizer(visualizer)
                 self.print_stats()
 
         # Final visualization
         if visualizer:
+            flush_visualizer(visualizer)
             print(f"\n=== Final State (Tick {self.tick_number}) ===")
             visualizer.render(self)
+            flush_visualizer(visualizer)
 
         # Final stats
         print(f"\n=== Final Statistics ===")
@@ -192,11 +217,11 @@ class Simulation:
 
     def print_stats(self):
         """Print current simulation statistics."""
-        living_planets = len(self.grid.get_living_planets())
-        total_planets = len(self.grid.get_all_planets())
-        asteroids_with_life = len(self.grid.get_asteroids_with_life())
-        total_asteroids = len(self.grid.asteroids)
-        alive_stars = sum(1 for s in self.grid.stars if s.is_alive)
+        living_planets = self.grid.living_planet_count
+        total_planets = len(self.grid.planets)
+        asteroids_with_life = self.grid.life_asteroid_count
+        total_asteroids = self.grid.asteroid_count
+        alive_stars = self.grid.alive_star_count
 
         print(f"Tick {self.tick_number}: "
               f"Living Planets: {living_planets}/{total_planets}, "
@@ -221,10 +246,10 @@ class Simulation:
         """
         return {
             'tick': self.tick_number,
-            'total_planets': len(self.grid.get_all_planets()),
-            'living_planets': len(self.grid.get_living_planets()),
-            'total_asteroids': len(self.grid.asteroids),
-            'asteroids_with_life': len(self.grid.get_asteroids_with_life()),
-            'alive_stars': sum(1 for s in self.grid.stars if s.is_alive),
+            'total_planets': len(self.grid.planets),
+            'living_planets': self.grid.living_planet_count,
+            'total_asteroids': self.grid.asteroid_count,
+            'asteroids_with_life': self.grid.life_asteroid_count,
+            'alive_stars': self.grid.alive_star_count,
             'total_stars': len(self.grid.stars),
         }
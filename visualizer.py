@@ -3,18 +3,219 @@ Visualization for the Panspermia Simulation.
 Provides ASCII-based rendering of the simulation state.
 """
 
+import codecs
+import functools
+import os
+import queue
+import shutil
+import sys
+import threading
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the NumPy rasterizer is used instead
+    njit = None
+
+# Canvas glyphs, one byte each. All are Latin-1, so the canvas decodes
+# straight to text.
+EMPTY = ord('.')
+LIVING_STAR = ord('*')
+DEAD_STAR = ord('x')
+HIGH_LIFE = ord('O')
+MEDIUM_LIFE = ord('o')
+LOW_LIFE = ord('°')
+NO_LIFE = ord('·')
+ASTEROID_LIFE = ord('#')
+ASTEROID_NO_LIFE = ord('+')
+
+# Planets are drawn in tiers by life level: no life, low, medium (above
+# MEDIUM_LIFE_LEVEL) and high (above HIGH_LIFE_LEVEL)
+MEDIUM_LIFE_LEVEL = 0.3
+HIGH_LIFE_LEVEL = 0.7
+PLANET_GLYPHS = np.array([NO_LIFE, LOW_LIFE, MEDIUM_LIFE, HIGH_LIFE], dtype=np.uint8)
+
+# When several grid cells share a canvas cell (scale > 1), the glyph
+# drawn is the one with the highest priority: asteroids over stars over
+# planets, more life over less. GLYPH_BY_PRIORITY maps a priority back
+# to its glyph.
+GLYPH_BY_PRIORITY = np.array(
+    [EMPTY, NO_LIFE, LOW_LIFE, MEDIUM_LIFE, HIGH_LIFE, DEAD_STAR, LIVING_STAR, ASTEROID_NO_LIFE, ASTEROID_LIFE],
+    dtype=np.uint8,
+)
+PRIORITY = {int(glyph): priority for priority, glyph in enumerate(GLYPH_BY_PRIORITY)}
+
+# ANSI escapes saving and restoring the cursor position
+SAVE_CURSOR = "\0337"
+RESTORE_CURSOR = "\0338"
+
+# Seconds between checks that the background writer is still running while
+# waiting on it
+WRITER_POLL_INTERVAL = 0.1
+
+# Below this many entities the JIT rasterizer's call overhead outweighs
+# the work it saves, so the NumPy path is used
+JIT_MIN_ENTITIES = 100
+
+
+if njit is not None:
+    @functools.lru_cache(maxsize=None)
+    def _make_rasterizer(width: int, height: int, scale: int):
+        """
+        Compile a rasterizer specialized for one canvas size and scale.
+
+        The size and scale are compile-time constants of the generated code,
+        so Numba folds the bounds checks and turns division by a power-of-two
+        scale into a shift. Entities are marked as priorities (see
+        GLYPH_BY_PRIORITY): at scale 1 later entities overwrite earlier
+        ones, above it each canvas cell keeps its highest-priority occupant,
+        matching the tiled reduction of the NumPy path.
+        """
+        downsample = scale > 1
+        living_star = PRIORITY[LIVING_STAR]
+        dead_star = PRIORITY[DEAD_STAR]
+        no_life = PRIORITY[NO_LIFE]
+        asteroid_life = PRIORITY[ASTEROID_LIFE]
+        asteroid_no_life = PRIORITY[ASTEROID_NO_LIFE]
+
+        @njit(inline='always')
+        def mark(priority, x, y, value):
+            x //= scale
+            y //= scale
+            if 0 <= x < width and 0 <= y < height:
+                if not downsample or value > priority[y, x]:
+                    priority[y, x] = value
+
+        @njit(cache=True)
+        def rasterize(canvas, priority, star_xy, star_alive, planet_xy, planet_has_life,
+                      planet_life_level, asteroid_pos, asteroid_contains_life, asteroid_dead):
+            priority[:] = 0
+
+            for i in range(star_xy.shape[0]):
+                mark(priority, star_xy[i, 0], star_xy[i, 1], living_star if star_alive[i] else dead_star)
+
+            for i in range(planet_xy.shape[0]):
+                if not planet_has_life[i]:
+                    tier = 0
+                elif planet_life_level[i] > HIGH_LIFE_LEVEL:
+                    tier = 3
+                elif planet_life_level[i] > MEDIUM_LIFE_LEVEL:
+                    tier = 2
+                else:
+                    tier = 1
+                mark(priority, planet_xy[i, 0], planet_xy[i, 1], no_life + tier)
+
+            for i in range(asteroid_pos.shape[0]):
+                if asteroid_dead[i]:
+                    continue
+                mark(
+                    priority,
+                    int(asteroid_pos[i, 0]),
+                    int(asteroid_pos[i, 1]),
+                    asteroid_life if asteroid_contains_life[i] else asteroid_no_life,
+                )
+
+            for y in range(height):
+                for x in range(width):
+                    canvas[y, x] = GLYPH_BY_PRIORITY[priority[y, x]]
+
+        return rasterize
+else:
+    _make_rasterizer = None
+
+
+def _cells_inside(shape, positions, values):
+    """
+    Cells of an array of the given shape holding integer-truncated positions.
+
+    Returns:
+        Row indices, column indices and values of the positions that fall
+        inside the array
+    """
+    height, width = shape
+    xy = positions.astype(np.int64, copy=False)
+    x = xy[:, 0]
+    y = xy[:, 1]
+    inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+    return y[inside], x[inside], values[inside]
+
+
+def _planet_tiers(grid) -> np.ndarray:
+    """Life tier of every planet, indexing PLANET_GLYPHS (0 = no life)."""
+    tiers = np.digitize(grid.planet_life_level, (MEDIUM_LIFE_LEVEL, HIGH_LIFE_LEVEL), right=True) + 1
+    tiers[~grid.planet_has_life] = 0
+    return tiers
+
+
+def flush_visualizer(visualizer):
+    """Wait for a visualizer's pending output, if it writes in the background."""
+    flush = getattr(visualizer, 'flush', None)
+    if flush is not None:
+        flush()
+
+
+def close_visualizer(visualizer):
+    """Stop a visualizer's background writer, if it has one."""
+    close = getattr(visualizer, 'close', None)
+    if close is not None:
+        close()
+
 
 class ASCIIVisualizer:
     """ASCII-based visualizer for the simulation."""
 
-    def __init__(self, scale: int = 1):
+    LEGEND = (
+        "\nLegend:\n"
+        "  * = Living star     x = Dead star\n"
+        "  O = High life       o = Medium life    ° = Low life    · = No life (planet)\n"
+        "  # = Asteroid (life) + = Asteroid (no life)\n"
+        "  . = Empty space\n"
+    )
+    LEGEND_WIDTH = max(len(line) for line in LEGEND.split("\n"))
+
+    def __init__(self, scale: int = 1, incremental: bool = False, background: bool = False):
         """
         Initialize the visualizer.
 
         Args:
             scale: Scaling factor for the visualization (1 = full grid, 2 = half size, etc.)
+            incremental: On a terminal, draw the frame once and then only
+                redraw the cells that changed, instead of printing a full
+                frame every render. Call flush() before writing anything
+                else to stdout; the next render then starts a new frame.
+            background: Write full frames to stdout from a background thread so
+                rendering doesn't wait on a slow terminal. Call flush() before
+                writing anything else to stdout.
         """
         self.scale = scale
+        self.incremental = incremental
+        self.background = background
+
+        # Frame buffer reused across renders: the bordered frame as bytes,
+        # with the canvas a view of its interior. Rebuilt if the size changes.
+        self._frame_shape = None
+        self._frame = None
+        self._canvas = None
+
+        # Priority grid reused by the JIT rasterizer and when downsampling
+        self._priority = None
+
+        # How frames are encoded and written, set up for the stdout stream
+        # last written to
+        self._stdout = None
+        self._encoding = None
+        self._latin1_output = False
+        self._legend_bytes = b''
+        self._raw_fd = None
+
+        # Canvas last drawn on screen by an incremental render
+        self._prev_canvas = None
+
+        # Background writer: frames waiting to be written, at most one at a
+        # time so a slow terminal holds rendering back instead of queueing
+        self._queue = None
+        self._writer = None
+        self._write_error = None
 
     def render(self, simulation):
         """
@@ -27,62 +228,301 @@ class ASCIIVisualizer:
         width = grid.width // self.scale
         height = grid.height // self.scale
 
-        # Create empty grid
-        display = [['.' for _ in range(width)] for _ in range(height)]
+        canvas = self._frame_buffer(width, height)
+        num_entities = len(grid.stars) + len(grid.planets) + grid.asteroid_count
+        if _make_rasterizer is not None and num_entities >= JIT_MIN_ENTITIES:
+            rasterize = _make_rasterizer(width, height, self.scale)
+            rasterize(
+                canvas,
+                self._priority_buffer((height, width)),
+                grid.star_xy,
+                grid.star_alive,
+                grid.planet_xy,
+                grid.planet_has_life,
+                grid.planet_life_level,
+                grid.asteroid_pos,
+                grid.asteroid_contains_life,
+                grid.asteroid_dead,
+            )
+        elif self.scale > 1:
+            self._downsample(canvas, grid)
+        else:
+            canvas.fill(EMPTY)
+            self._draw_entities(canvas, grid)
 
-        # Place stars and planets
-        for star in grid.stars:
-            sx, sy = self._scale_position(star.position)
-            if 0 <= sx < width and 0 <= sy < height:
-                if star.is_alive:
-                    display[sy][sx] = '*'
-                else:
-                    display[sy][sx] = 'x'  # Dead star
-
-            # Place planets
-            for planet in star.planets:
-                px, py = self._scale_position(planet.position)
-                if 0 <= px < width and 0 <= py < height:
-                    if planet.has_life:
-                        # Use different symbols based on life level
-                        if planet.life_level > 0.7:
-                            display[py][px] = 'O'  # High life
-                        elif planet.life_level > 0.3:
-                            display[py][px] = 'o'  # Medium life
-                        else:
-                            display[py][px] = '°'  # Low life
-                    else:
-                        display[py][px] = '·'  # No life
+        if self.incremental and self._can_redraw_in_place(width, height):
+            self._redraw_changes(canvas)
+        else:
+            self._prev_canvas = None
+            self._write_frame()
+
+    def _can_redraw_in_place(self, width: int, height: int) -> bool:
+        """
+        Whether stdout is a terminal big enough to hold the frame and legend.
+
+        Lines wider than the terminal wrap onto extra rows, which would throw
+        off the relative cursor moves of an in-place redraw.
+        """
+        if not sys.stdout.isatty():
+            return False
+        columns, lines = shutil.get_terminal_size()
+        return (
+            self._screen_rows(height) < lines
+            and width + 2 <= columns
+            and self.LEGEND_WIDTH <= columns
+        )
+
+    def _screen_rows(self, height: int) -> int:
+        """Number of terminal rows taken by a frame and its legend."""
+        return height + 2 + self.LEGEND.count("\n")
+
+    def _redraw_changes(self, canvas):
+        """Update the frame on screen, rewriting only the cells that changed."""
+        self._drain_writer()
+        prev = self._prev_canvas
+        if prev is None or prev.shape != canvas.shape:
+            # First frame, or other output since the last one: draw in full
+            self._write_frame()
+            self._prev_canvas = canvas.copy()
+            return
+
+        ys, xs = np.nonzero(canvas != prev)
+        glyphs = canvas[ys, xs].tobytes().decode('latin-1')
+        # The cursor sits just below the legend, where the last full frame
+        # left it. Each cell is reached from there by moving up to its row
+        # and across to its column (1-based, past the border), and the
+        # cursor is restored at the end.
+        rows_above = self._screen_rows(canvas.shape[0]) - 1
+        out = [SAVE_CURSOR]
+        out.extend(
+            f"{RESTORE_CURSOR}\033[{rows_above - y}A\033[{x + 2}G{glyph}"
+            for y, x, glyph in zip(ys.tolist(), xs.tolist(), glyphs)
+        )
+        out.append(RESTORE_CURSOR)
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+        prev[...] = canvas
+
+    def _write_frame(self):
+        """
+        Write the frame and legend to stdout.
+
+        The frame is handed to the underlying binary buffer already encoded,
+        bypassing the text layer's encoder, or to the file descriptor itself
+        when stdout is not a terminal. Pending text output is flushed first
+        so the frame stays in order with print() output.
+        """
+        stdout = sys.stdout
+        buffer = getattr(stdout, 'buffer', None)
+        if buffer is None:  # Text-only stream, e.g. redirected to a StringIO
+            stdout.write(self._frame.decode('latin-1') + self.LEGEND)
+            return
+
+        if stdout is not self._stdout or stdout.encoding != self._encoding:
+            self._set_up_output(stdout)
+        if self._latin1_output:
+            frame = self._frame
+        else:
+            frame = self._frame.decode('latin-1').encode(self._encoding, stdout.errors)
+
+        stdout.flush()
+        if self.background:
+            # The frame buffer is redrawn by the next render, so the writer
+            # gets its own copy of the bytes
+            self._submit(buffer, self._raw_fd, frame + self._legend_bytes)
+            return
+        self._write_bytes(buffer, self._raw_fd, frame, self._legend_bytes)
+        if self._raw_fd is None and stdout.line_buffering:
+            buffer.flush()
+
+    def _set_up_output(self, stdout):
+        """Cache the encoded legend and the write path for a stdout stream."""
+        self._stdout = stdout
+        self._encoding = stdout.encoding
+        self._latin1_output = codecs.lookup(self._encoding).name == 'iso8859-1'
+        self._legend_bytes = self.LEGEND.encode(self._encoding, stdout.errors)
+
+        # Pipes and files are written with os.write on the file descriptor,
+        # skipping Python's buffered I/O; terminals keep the buffered path
+        self._raw_fd = None
+        try:
+            if not stdout.isatty():
+                self._raw_fd = stdout.fileno()
+        except (AttributeError, OSError, ValueError):  # No usable file descriptor
+            pass
+
+    @staticmethod
+    def _write_bytes(buffer, fd, *chunks):
+        """Write chunks to a binary buffer, or straight to a file descriptor if one is given."""
+        if fd is None:
+            for chunk in chunks:
+                buffer.write(chunk)
+            return
+        for chunk in chunks:
+            view = memoryview(chunk)
+            while view:
+                # os.write may write only part of the data
+                view = view[os.write(fd, view):]
+
+    def _submit(self, buffer, fd, data: bytes):
+        """Hand data to the background writer, waiting if a frame is still queued."""
+        self._raise_write_error()
+        if self._writer is None:
+            self._queue = queue.Queue(maxsize=1)
+            self._writer = threading.Thread(target=self._write_in_background, daemon=True)
+            self._writer.start()
+        self._put((buffer, fd, data))
+
+    def _put(self, item):
+        """Queue an item for the writer, raising instead of blocking if it has stopped."""
+        while True:
+            self._check_writer_alive()
+            try:
+                self._queue.put(item, timeout=WRITER_POLL_INTERVAL)
+                return
+            except queue.Full:
+                pass
+
+    def _check_writer_alive(self):
+        """Raise if the background writer thread has stopped unexpectedly."""
+        if not self._writer.is_alive():
+            self._raise_write_error()
+            raise RuntimeError("background frame writer has stopped")
+
+    def _write_in_background(self):
+        """
+        Background writer loop; a None item stops it.
+
+        Once a write fails, later frames are dropped until the main thread
+        has re-raised the error, but the queue keeps being drained so the
+        main thread never blocks on it.
+        """
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                if self._write_error is None:
+                    buffer, fd, data = item
+                    self._write_bytes(buffer, fd, data)
+                    if fd is None:
+                        buffer.flush()
+            except Exception as e:  # e.g. a closed pipe or file; reported on the main thread
+                self._write_error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_write_error(self):
+        """Re-raise an error hit by the background writer."""
+        if self._write_error is not None:
+            error, self._write_error = self._write_error, None
+            raise error
+
+    def flush(self):
+        """
+        Wait until all frames handed to the background writer are written.
+
+        Call before writing anything else to stdout. The frame on screen is
+        then treated as stale, so an incremental render draws a new full
+        frame below that output instead of redrawing cells above it.
+        """
+        self._drain_writer()
+        self._prev_canvas = None
+
+    def _drain_writer(self):
+        """Wait until all frames handed to the background writer are written."""
+        if self._writer is not None:
+            done = self._queue.all_tasks_done
+            with done:
+                while self._queue.unfinished_tasks:
+                    self._check_writer_alive()
+                    done.wait(WRITER_POLL_INTERVAL)
+        self._raise_write_error()
+
+    def close(self):
+        """Write any pending frame and stop the background writer."""
+        if self._writer is not None:
+            self._put(None)
+            self._writer.join()
+            self._writer = None
+            self._queue = None
+        self._raise_write_error()
+
+    def _frame_buffer(self, width: int, height: int) -> np.ndarray:
+        """
+        Return the canvas for a frame size, allocating the frame on size change.
+
+        The frame holds the border, side bars and newlines at fixed offsets,
+        so only the canvas needs to be redrawn each render.
+
+        Returns:
+            (height, width) uint8 view of the frame interior
+        """
+        if self._frame_shape != (height, width):
+            stride = width + 3  # '|' + row + '|' + newline
+            frame = bytearray((height + 2) * stride)
+            rows = np.frombuffer(frame, dtype=np.uint8).reshape(height + 2, stride)
+            rows[:, 0] = rows[:, width + 1] = ord('|')
+            rows[[0, -1], 1:width + 1] = ord('-')
+            rows[[0, -1], 0] = rows[[0, -1], width + 1] = ord('+')
+            rows[:, -1] = ord('\n')
+            self._frame = frame
+            self._canvas = rows[1:-1, 1:width + 1]
+            self._frame_shape = (height, width)
+        return self._canvas
+
+    def _priority_buffer(self, shape) -> np.ndarray:
+        """Return the reusable uint8 priority grid, reallocated on shape change."""
+        if self._priority is None or self._priority.shape != shape:
+            self._priority = np.empty(shape, dtype=np.uint8)
+        return self._priority
+
+    def _draw_entities(self, canvas, grid):
+        """Draw stars, then planets, then asteroids onto a full-resolution canvas with NumPy."""
+        # Place stars
+        star_glyphs = np.where(grid.star_alive, LIVING_STAR, DEAD_STAR)
+        self._scatter(canvas, grid.star_xy, star_glyphs)
+
+        # Place planets, with different symbols based on life level
+        self._scatter(canvas, grid.planet_xy, PLANET_GLYPHS[_planet_tiers(grid)])
 
         # Place asteroids (they render on top)
-        for asteroid in grid.asteroids:
-            ax, ay = self._scale_position(asteroid.position)
-            if 0 <= ax < width and 0 <= ay < height:
-                if asteroid.contains_life:
-                    display[ay][ax] = '#'  # Asteroid with life
-                else:
-                    display[ay][ax] = '+'  # Asteroid without life
+        live = ~grid.asteroid_dead
+        asteroid_glyphs = np.where(grid.asteroid_contains_life[live], ASTEROID_LIFE, ASTEROID_NO_LIFE)
+        self._scatter(canvas, grid.asteroid_pos[live], asteroid_glyphs)
+
+    def _downsample(self, canvas, grid):
+        """
+        Draw the grid at full resolution as priorities, then max-reduce it
+        onto the canvas in scale x scale tiles.
+        """
+        height, width = canvas.shape
+        scale = self.scale
+        full = self._priority_buffer((grid.height, grid.width))
+        full.fill(PRIORITY[EMPTY])
 
-        # Print the grid
-        print("+" + "-" * width + "+")
-        for row in display:
-            print("|" + "".join(row) + "|")
-        print("+" + "-" * width + "+")
+        self._mark(full, grid.planet_xy, PRIORITY[NO_LIFE] + _planet_tiers(grid))
+        self._mark(full, grid.star_xy, np.where(grid.star_alive, PRIORITY[LIVING_STAR], PRIORITY[DEAD_STAR]))
+        live = ~grid.asteroid_dead
+        asteroid_priorities = np.where(
+            grid.asteroid_contains_life[live], PRIORITY[ASTEROID_LIFE], PRIORITY[ASTEROID_NO_LIFE]
+        )
+        self._mark(full, grid.asteroid_pos[live], asteroid_priorities)
 
-        # Print legend
-        self._print_legend()
+        tiles = full[:height * scale, :width * scale].reshape(height, scale, width, scale)
+        canvas[...] = GLYPH_BY_PRIORITY[tiles.max(axis=(1, 3))]
 
-    def _scale_position(self, position):
-        """Scale a position according to the scale factor."""
-        return (int(position[0]) // self.scale, int(position[1]) // self.scale)
+    @staticmethod
+    def _mark(full, positions, priorities):
+        """Raise cells of the priority grid to the given priorities, dropping positions off the grid."""
+        y, x, priorities = _cells_inside(full.shape, positions, priorities)
+        np.maximum.at(full, (y, x), priorities.astype(np.uint8))
 
-    def _print_legend(self):
-        """Print the legend for the visualization."""
-        print("\nLegend:")
-        print("  * = Living star     x = Dead star")
-        print("  O = High life       o = Medium life    ° = Low life    · = No life (planet)")
-        print("  # = Asteroid (life) + = Asteroid (no life)")
-        print("  . = Empty space")
+    @staticmethod
+    def _scatter(canvas, positions, glyphs):
+        """Write glyphs at positions on a full-resolution canvas, dropping those off it."""
+        y, x, glyphs = _cells_inside(canvas.shape, positions, glyphs)
+        canvas[y, x] = glyphs
 
 
 class CompactVisualizer:
@@ -92,10 +532,13 @@ class CompactVisualizer:
         """Render compact statistics."""
         stats = simulation.get_stats()
 
-        print(f"\n--- Tick {stats['tick']} ---")
-        print(f"Living Planets: {stats['living_planets']}/{stats['total_planets']}")
-        print(f"Stars Alive: {stats['alive_stars']}/{stats['total_stars']}")
-        print(f"Asteroids: {stats['total_asteroids']} ({stats['asteroids_with_life']} with life)")
+        out = [
+            f"\n--- Tick {stats['tick']} ---",
+            f"Living Planets: {stats['living_planets']}/{stats['total_planets']}",
+            f"Stars Alive: {stats['alive_stars']}/{stats['total_stars']}",
+            f"Asteroids: {stats['total_asteroids']} ({stats['asteroids_with_life']} with life)",
+        ]
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 class DetailedVisualizer:
@@ -104,30 +547,44 @@ class DetailedVisualizer:
     def render(self, simulation):
         """Render detailed entity information."""
         grid = simulation.grid
-
-        print(f"\n=== Tick {simulation.tick_number} ===")
+        out = [f"\n=== Tick {simulation.tick_number} ==="]
 
         # Stars
-        print(f"\nStars ({len(grid.stars)}):")
-        for i, star in enumerate(grid.stars[:5]):  # Show first 5
+        stars = grid.stars
+        num_stars = len(stars)
+        out.append(f"\nStars ({num_stars}):")
+        for i in range(min(5, num_stars)):  # Show first 5
+            star = stars[i]
             status = "alive" if star.is_alive else "DEAD"
-            print(f"  {i+1}. {star.position} - {status}, age {star.age}/{star.lifetime}, {len(star.planets)} planets")
-        if len(grid.stars) > 5:
-            print(f"  ... and {len(grid.stars) - 5} more")
-
-        # Planets with life
-        living_planets = grid.get_living_planets()
-        print(f"\nLiving Planets ({len(living_planets)}):")
-        for i, planet in enumerate(living_planets[:10]):  # Show first 10
-            print(f"  {i+1}. {planet.position} - life={planet.life_level:.2f}, hab={planet.habitability:.2f}")
-        if len(living_planets) > 10:
-            print(f"  ... and {len(living_planets) - 10} more")
-
-        # Asteroids
-        asteroids_with_life = grid.get_asteroids_with_life()
-        print(f"\nAsteroids with Life ({len(asteroids_with_life)}):")
-        for i, asteroid in enumerate(asteroids_with_life[:10]):  # Show first 10
-            print(f"  {i+1}. pos=({asteroid.position[0]:.1f},{asteroid.position[1]:.1f}), "
-                  f"viability={asteroid.life_viability:.2f}")
-        if len(asteroids_with_life) > 10:
-            print(f"  ... and {len(asteroids_with_life) - 10} more")
+            out.append(f"  {i+1}. {star.position} - {status}, age {star.age}/{star.lifetime}, {len(star.planets)} planets")
+        if num_stars > 5:
+            out.append(f"  ... and {num_stars - 5} more")
+
+        # Planets with life, formatted straight from the planet arrays
+        num_living_planets = grid.living_planet_count
+        out.append(f"\nLiving Planets ({num_living_planets}):")
+        shown = np.flatnonzero(grid.planet_has_life)[:10]  # Show first 10
+        rows = zip(
+            range(1, len(shown) + 1),
+            grid.planet_xy[shown].tolist(),
+            grid.planet_life_level[shown].tolist(),
+            grid.planet_habitability[shown].tolist(),
+        )
+        out.extend("  %d. (%d, %d) - life=%.2f, hab=%.2f" % (i, x, y, life, hab) for i, (x, y), life, hab in rows)
+        if num_living_planets > 10:
+            out.append(f"  ... and {num_living_planets - 10} more")
+
+        # Asteroids with life, formatted straight from the asteroid arrays
+        num_life_asteroids = grid.life_asteroid_count
+        out.append(f"\nAsteroids with Life ({num_life_asteroids}):")
+        shown = np.flatnonzero(grid.asteroid_contains_life)[:10]  # Show first 10
+        rows = zip(
+            range(1, len(shown) + 1),
+            grid.asteroid_pos[shown].tolist(),
+            grid.asteroid_viability[shown].tolist(),
+        )
+        out.extend("  %d. pos=(%.1f,%.1f), viability=%.2f" % (i, x, y, viability) for i, (x, y), viability in rows)
+        if num_life_asteroids > 10:
+            out.append(f"  ... and {num_life_asteroids - 10} more")
+
+        sys.stdout.write("\n".join(out) + "\n")